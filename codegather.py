@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 
 import os
+import stat
+import sys
+import re
 import fnmatch
 from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import itertools
+import threading
 
 # --- Configuration ---
 DEFAULT_CONFIG_FILENAME = ".codegatherignore"
@@ -14,6 +21,10 @@ DEFAULT_ENCODING = 'utf-8'
 DEFAULT_SCRIPT_INCLUDE_EXTENSIONS = ["*.js", "*.jsx"] # Fallback if no includes in config
 SESSION_PROMPT_CODE_SEPARATOR = "\n\n--> code files combine starts here: <--\n\n"
 FILES_COUNT_WARNING_THRESHOLD = 300
+READ_WORKERS = 8 # Threads reading source files ahead of the writer
+READ_AHEAD = 16 # Max number of files read ahead of the one being written
+READ_CHUNK_SIZE = 1 << 16 # os.read() size for source files
+OUTPUT_BUFFER_SIZE = 1 << 20 # Write buffer for the combined output file
 
 DEFAULT_CONFIG_TEMPLATE = """\
 # CodeGather Configuration File (.codegatherignore)
@@ -77,7 +88,32 @@ Thank you.
 
 # --- Helper Functions ---
 
+# Parsed configs keyed by path, stamped with (st_mtime_ns, st_size, st_ino) so an edited file is re-read.
+# Locked so the module can be used from a long-running, multi-threaded host (editor integration, file watcher).
+_config_cache = {}
+_config_cache_lock = threading.Lock()
+
 def parse_config(config_file_path: Path, verbose: bool = False):
+    path_str = str(config_file_path)
+    try:
+        st = os.stat(path_str)
+    except OSError: # Missing config: nothing to cache, the parser falls back to script defaults
+        return _parse_config_uncached(config_file_path, False, verbose)
+
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _config_cache_lock:
+        cached = _config_cache.get(path_str)
+    if cached is not None and cached[0] == stamp:
+        if verbose: print(f"⚙️ Using cached config: {config_file_path}")
+        return cached[1]
+
+    result = _parse_config_uncached(config_file_path, stat.S_ISREG(st.st_mode), verbose)
+    with _config_cache_lock:
+        _config_cache[path_str] = (stamp, result)
+    return result
+
+
+def _parse_config_uncached(config_file_path: Path, config_is_file: bool, verbose: bool = False):
     loaded_config_settings = {
         "output_file": None,
         "no_header": None,
@@ -87,7 +123,7 @@ def parse_config(config_file_path: Path, verbose: bool = False):
     include_extension_patterns = [] # For patterns like *.js directly listed
     exclude_patterns = []
 
-    if config_file_path.is_file():
+    if config_is_file:
         if verbose: print(f"⚙️ Reading config file: {config_file_path}")
         with open(config_file_path, 'r', encoding=DEFAULT_ENCODING) as f:
             for line_num, line_content in enumerate(f, 1):
@@ -98,7 +134,7 @@ def parse_config(config_file_path: Path, verbose: bool = False):
                 # Handle key-value pairs
                 if ':' in stripped_line:
                     key_raw, value_raw = stripped_line.split(':', 1)
-                    key = key_raw.strip().lower().replace('-', '_')
+                    key = sys.intern(key_raw.strip().lower().replace('-', '_')) # Compared against the literal key names below
 
                     # Strip inline comments from the value part
                     if '#' in value_raw:
@@ -157,46 +193,236 @@ def parse_config(config_file_path: Path, verbose: bool = False):
     return loaded_config_settings, final_include_extensions, exclude_patterns
 
 
-def is_excluded(item_path_abs: Path, root_path_abs: Path, exclude_patterns: list, output_file_path_abs: Path, verbose: bool = False) -> bool:
-    if item_path_abs == output_file_path_abs: # pragma: no cover (hard to test this specific scenario reliably)
-        if verbose: print(f"DEBUG: Excluding output file itself: {item_path_abs.relative_to(root_path_abs) if item_path_abs.is_relative_to(root_path_abs) else item_path_abs}")
-        return True
-    try:
-        relative_item_path = item_path_abs.relative_to(root_path_abs)
-    except ValueError: # pragma: no cover
-        if verbose: print(f"DEBUG: Item '{item_path_abs}' is not relative to root '{root_path_abs}'. Treating as excluded.")
-        return True
-    
-    # Normalize path separators for cross-platform pattern matching
-    relative_item_path_str_normalized = str(relative_item_path).replace('\\', '/')
+def _glob_union_source(patterns: list) -> str:
+    # One alternation of translated globs: a single regex call replaces a Python loop of fnmatchcase() calls.
+    return "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns)
+
+
+def _compile_glob_union(patterns: list):
+    return re.compile(_glob_union_source(patterns)) if patterns else None
+
+
+def _compile_name_matcher(exclude_globs: list, include_globs: list):
+    # Basename excludes and non-suffix includes in one regex; match.lastgroup tells which side matched.
+    # The exclude group comes first, so a name matching both is excluded, as before.
+    alternatives = []
+    if exclude_globs:
+        alternatives.append(f"(?P<exc>{_glob_union_source(exclude_globs)})")
+    if include_globs:
+        alternatives.append(f"(?P<inc>{_glob_union_source(include_globs)})")
+    return re.compile("|".join(alternatives)) if alternatives else None
 
-    for pattern_idx, pattern_orig in enumerate(exclude_patterns):
+
+def normalize_exclude_patterns(exclude_patterns: list) -> list:
+    # Strips and normalizes each pattern once into a typed (kind, key, original pattern) rule:
+    #   "dir"       - 'foo/' patterns, key is the relative dir path without the trailing '/'
+    #   "glob_path" - patterns containing '/', key is matched against the full relative path
+    #   "glob_name" - plain patterns, key is matched against the file name
+    exclude_rules = []
+    for pattern_orig in exclude_patterns:
         p_stripped = pattern_orig.strip()
         if not p_stripped: continue
 
         p_normalized = p_stripped.replace('\\', '/') # Normalize pattern separators
+        if p_normalized.endswith('/'):
+            exclude_rules.append(("dir", sys.intern(p_normalized.rstrip('/')), pattern_orig))
+        elif '/' in p_normalized:
+            exclude_rules.append(("glob_path", p_normalized, pattern_orig))
+        else:
+            exclude_rules.append(("glob_name", p_stripped, pattern_orig))
+    return exclude_rules
 
-        is_dir_specific_pattern = p_normalized.endswith('/')
-        
-        # Match full path for directory patterns or patterns containing '/'
-        if is_dir_specific_pattern or '/' in p_normalized:
-            p_to_match = p_normalized.rstrip('/') # For dir match "foo/" against "foo" or "foo/bar"
-            if is_dir_specific_pattern:
-                 # Match if the path is the directory itself or is inside the directory
-                if relative_item_path_str_normalized == p_to_match or \
-                   relative_item_path_str_normalized.startswith(p_to_match + '/'):
-                    if verbose: print(f"DEBUG: Path '{relative_item_path}' excluded by directory pattern '{pattern_orig}' (rule #{pattern_idx})")
-                    return True
-            elif fnmatch.fnmatchcase(relative_item_path_str_normalized, p_normalized):
-                if verbose: print(f"DEBUG: Path '{relative_item_path}' excluded by full path glob pattern '{pattern_orig}' (rule #{pattern_idx})")
-                return True
-        # If pattern does not contain path separators, also try matching just the basename
-        elif '/' not in p_normalized: # implies also not dir_specific_pattern from above
-            if fnmatch.fnmatchcase(item_path_abs.name, p_stripped): # Use original stripped pattern for basename
-                if verbose: print(f"DEBUG: File/Dir name '{item_path_abs.name}' (in path '{relative_item_path}') excluded by basename pattern '{pattern_orig}' (rule #{pattern_idx})")
-                return True
+
+# Names the rule behind an exclusion in verbose output. Only called when such a message is printed, so a
+# per-pattern fnmatchcase() is fine here and nothing is compiled per rule on normal runs.
+def _first_matching_rule(exclude_rules: list, kind: str, text: str) -> str:
+    return next((pattern_orig for rule_kind, key, pattern_orig in exclude_rules if rule_kind == kind and fnmatch.fnmatchcase(text, key)), "?")
+
+
+def _classify_glob(pattern: str) -> tuple:
+    # Most patterns are '*.ext', 'name.ext' or 'dir/name'; those are matched with plain str operations
+    # (endswith, ==, set lookup) and only the remaining shapes go through a translated regex.
+    if not any(c in pattern for c in "*?["):
+        return "literal", pattern
+    if pattern.startswith("*.") and not any(c in pattern[1:] for c in "*?["):
+        return "suffix", pattern[1:] # '*.ext' matches exactly the names ending in '.ext'
+    return "glob", pattern
+
+
+def compile_patterns(include_patterns: list, exclude_patterns: list) -> dict:
+    include_suffixes = [] # '*.ext' patterns, tested with str.endswith
+    include_globs = [] # Any other include pattern
+    for pattern in include_patterns:
+        shape, key = _classify_glob(pattern)
+        if shape == "suffix":
+            include_suffixes.append(key)
+        else:
+            include_globs.append(pattern)
+
+    exclude_rules = normalize_exclude_patterns(exclude_patterns)
+    # A path is excluded if it or any of its parent dirs is in the set
+    dir_prefixes = {key for kind, key, _ in exclude_rules if kind == "dir"}
+    path_literals = set()
+    path_globs = []
+    exclude_names = set()
+    exclude_suffixes = []
+    basename_globs = []
+    for kind, key, _ in exclude_rules:
+        if kind == "dir":
+            continue
+        shape, shape_key = _classify_glob(key)
+        if kind == "glob_path":
+            if shape == "literal":
+                path_literals.add(key)
+            else:
+                path_globs.append(key)
+        elif shape == "literal":
+            exclude_names.add(shape_key)
+        elif shape == "suffix":
+            exclude_suffixes.append(shape_key)
+        else:
+            basename_globs.append(key)
+
+    return {
+        "include_suffixes": tuple(include_suffixes),
+        "exclude_names": frozenset(exclude_names),
+        "exclude_suffixes": tuple(exclude_suffixes),
+        "basename_exclude_re": _compile_glob_union(basename_globs),
+        # Only needed for names that miss the suffix fast path, so only built when there are glob includes
+        "name_re": _compile_name_matcher(basename_globs, include_globs) if include_globs else None,
+        "dir_prefixes": dir_prefixes,
+        "path_literals": path_literals,
+        "path_glob_re": _compile_glob_union(path_globs),
+        "exclude_rules": exclude_rules,
+    }
+
+
+# Path-level exclusion (directory and full-path patterns); basename patterns are handled in _walk().
+def is_excluded(rel_str: str, patterns: dict, verbose: bool = False) -> bool:
+    # rel_str is the path relative to the project root, already normalized to '/' separators
+    # Only the path itself is looked up: _walk() reaches a path only after all its parent dirs passed dir_prefixes
+    if rel_str in patterns["dir_prefixes"]:
+        if verbose: print(f"DEBUG: Path '{rel_str}' excluded by directory pattern '{rel_str}/'")
+        return True
+    path_glob_re = patterns["path_glob_re"]
+    if rel_str in patterns["path_literals"] or (path_glob_re and path_glob_re.match(rel_str)):
+        if verbose: print(f"DEBUG: Path '{rel_str}' excluded by full path glob pattern '{_first_matching_rule(patterns['exclude_rules'], 'glob_path', rel_str)}'")
+        return True
     return False
 
+
+def _is_under(child: Path, parent: Path) -> bool:
+    # Plain string prefix test on absolute paths, instead of Path.is_relative_to() and its ValueError round trip
+    return os.fspath(child).startswith(os.path.join(os.fspath(parent), ''))
+
+
+# Yields (absolute path, relative path) string pairs for included files under root_path,
+# pruning excluded directories before descending into them. Relative paths always use '/'.
+def _walk(root_path: Path, patterns: dict, output_file_path_abs: Path, session_prompt_path_abs: Path = None, verbose: bool = False):
+    dir_prefixes = patterns["dir_prefixes"]
+    include_suffixes = patterns["include_suffixes"]
+    exclude_names = patterns["exclude_names"]
+    exclude_suffixes = patterns["exclude_suffixes"]
+    basename_exclude_re = patterns["basename_exclude_re"]
+    name_re = patterns["name_re"]
+    if not include_suffixes and name_re is None: # No include patterns, nothing can match
+        return
+    # Files outside the root can never be reached by the scan, so there is nothing to compare against
+    output_file_abs_str = os.fspath(output_file_path_abs) if _is_under(output_file_path_abs, root_path) else None
+    session_prompt_abs_str = os.fspath(session_prompt_path_abs) if session_prompt_path_abs and _is_under(session_prompt_path_abs, root_path) else None
+
+    # Depth-first stack of (absolute dir, relative dir) pairs; subdirs are pushed in reverse to keep rglob's order.
+    pending_dirs = deque([(str(root_path), "")])
+    while pending_dirs:
+        dir_abs, dir_rel = pending_dirs.pop()
+        try:
+            with os.scandir(dir_abs) as it:
+                entries = list(it)
+        except OSError as e:
+            if verbose: print(f"DEBUG: Could not scan directory '{dir_abs}': {e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel = f"{dir_rel}/{entry.name}" if dir_rel else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if rel in dir_prefixes: # Parent dirs were already checked before descending here
+                    if verbose: print(f"DEBUG: Directory '{rel}' excluded by directory pattern, skipping its contents")
+                    continue
+                subdirs.append((entry.path, rel))
+            elif entry.is_file(): # Follows symlinks to files, like Path.is_file()
+                # '*.ext' includes first: str.endswith(tuple) is a C-level compare, no regex state machine involved
+                if entry.name.endswith(include_suffixes):
+                    name_excluded = (entry.name in exclude_names or entry.name.endswith(exclude_suffixes)
+                                     or (basename_exclude_re is not None and basename_exclude_re.match(entry.name) is not None))
+                elif name_re:
+                    # One regex call settles basename excludes and glob includes for the remaining names
+                    name_match = name_re.match(entry.name)
+                    if not name_match:
+                        continue
+                    name_excluded = (name_match.lastgroup == "exc"
+                                     or entry.name in exclude_names or entry.name.endswith(exclude_suffixes))
+                else:
+                    continue
+                if name_excluded:
+                    if verbose: print(f"DEBUG: File name '{entry.name}' (in path '{rel}') excluded by basename pattern '{_first_matching_rule(patterns['exclude_rules'], 'glob_name', entry.name)}'")
+                    continue
+                if session_prompt_abs_str and entry.path == session_prompt_abs_str:
+                    if verbose: print(f"DEBUG: Excluding session prompt file itself: {rel}")
+                    continue
+                if output_file_abs_str and entry.path == output_file_abs_str:
+                    if verbose: print(f"DEBUG: Excluding output file itself: {rel}")
+                    continue
+                if is_excluded(rel, patterns, verbose):
+                    continue
+                if verbose: print(f"  ➕ Will include: {rel}")
+                yield entry.path, rel
+        pending_dirs.extend(reversed(subdirs))
+
+
+# Returns the prompt with its placeholder filled in and the code separator appended, already encoded for the
+# binary output (b"" for an empty prompt, which is not written at all).
+def _load_session_prompt(session_prompt_path: Path, root_dir_name: str) -> bytes:
+    with open(session_prompt_path, 'r', encoding=DEFAULT_ENCODING) as pf:
+        session_prompt_content = pf.read()
+    if not session_prompt_content:
+        return b""
+    session_prompt_content = session_prompt_content.replace("[root directory name]", root_dir_name)
+    return (session_prompt_content + SESSION_PROMPT_CODE_SEPARATOR).encode(DEFAULT_ENCODING)
+
+
+def _normalize_source_bytes(data: bytes) -> bytes:
+    # Same bytes as the former text-mode read (errors='replace', universal newlines). Pure ASCII, the common
+    # case for source files, is valid UTF-8 as is, so only other files pay for the strict decode (which builds
+    # and discards a str) and, when that fails, for the replacement round trip.
+    if not data.isascii():
+        try:
+            data.decode(DEFAULT_ENCODING)
+        except UnicodeDecodeError:
+            data = data.decode(DEFAULT_ENCODING, errors='replace').encode(DEFAULT_ENCODING)
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data
+
+
+def _read_bytes(file_abs_str: str) -> bytes:
+    # Raw fd reads: no buffered file object is set up for what is usually a small source file
+    fd = os.open(file_abs_str, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError: # Only a hint; some filesystems don't support it
+                pass
+        chunks = []
+        while True:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk: break
+            chunks.append(chunk)
+        return _normalize_source_bytes(b"".join(chunks))
+    finally:
+        os.close(fd)
+
 # --- Command Handler Functions ---
 
 def handle_init_command(args):
@@ -238,25 +464,32 @@ def handle_init_command(args):
 
 
 def handle_run_command(args):
+    # Paths are made absolute with os.path.abspath (lexical, no syscalls) rather than resolve(), which lstat()s
+    # every segment. The scan and the output/prompt checks all compare paths built the same way.
+    root_path = Path(os.path.abspath(args.root_dir))
     try:
-        root_path = Path(args.root_dir).resolve(strict=True)
+        root_stat = os.stat(root_path)
     except FileNotFoundError:
         print(f"❌ Error: Root directory '{args.root_dir}' not found.")
         return
-    if not root_path.is_dir():
+    if not stat.S_ISDIR(root_stat.st_mode):
         print(f"❌ Error: Root path '{root_path}' is not a directory.")
         return
 
+    # Existence of the config and session prompt files is checked once and reused below.
     if args.config:
-        config_file_path = Path(args.config).resolve()
-        if not config_file_path.is_file():
+        config_file_path = Path(os.path.abspath(args.config))
+        config_file_exists = config_file_path.is_file()
+        if not config_file_exists:
             print(f"⚠️ Warning: Custom config file '{config_file_path}' specified but not found. Using script defaults for includes/excludes.")
     else:
         config_file_path = root_path / DEFAULT_CONFIG_FILENAME
-        if not config_file_path.is_file() and args.verbose:
+        config_file_exists = config_file_path.is_file()
+        if not config_file_exists and args.verbose:
             print(f"ℹ️ Default config file '{config_file_path.name}' not found in '{root_path}'. Using script defaults for includes/excludes.")
 
     loaded_cfg_settings, final_include_extensions, final_exclude_patterns = parse_config(config_file_path, args.verbose)
+    compiled_patterns = compile_patterns(final_include_extensions, final_exclude_patterns)
 
     output_source_log = "script_default"
     final_output_path_str = DEFAULT_OUTPUT_FILENAME
@@ -269,9 +502,9 @@ def handle_run_command(args):
 
     temp_output_path = Path(final_output_path_str)
     if output_source_log == "config_file" and not temp_output_path.is_absolute():
-        final_output_path = (root_path / temp_output_path).resolve()
+        final_output_path = Path(os.path.abspath(root_path / temp_output_path))
     else:
-        final_output_path = temp_output_path.resolve()
+        final_output_path = Path(os.path.abspath(temp_output_path))
 
     final_no_header = DEFAULT_NO_HEADER_STATE
     if loaded_cfg_settings.get("no_header") is not None:
@@ -286,23 +519,24 @@ def handle_run_command(args):
     if args.session_prompt_file_cli:
         final_session_prompt_path_str = args.session_prompt_file_cli
         session_prompt_source_log = "cli"
-        final_session_prompt_path = Path(final_session_prompt_path_str).resolve()
+        final_session_prompt_path = Path(os.path.abspath(final_session_prompt_path_str))
     elif session_prompt_file_path_str_from_config:
         final_session_prompt_path_str = session_prompt_file_path_str_from_config
         session_prompt_source_log = "config_file"
         temp_prompt_path = Path(final_session_prompt_path_str)
         if not temp_prompt_path.is_absolute():
-            final_session_prompt_path = (root_path / temp_prompt_path).resolve()
+            final_session_prompt_path = Path(os.path.abspath(root_path / temp_prompt_path))
         else:
             final_session_prompt_path = temp_prompt_path
             
     use_session_prompt = not args.no_session_prompt and final_session_prompt_path is not None
+    session_prompt_exists = use_session_prompt and final_session_prompt_path.is_file()
     
     print(f"\nCodeGather: Running")
     print(f"---------------------------------")
     print(f"🌳 Project Root: {root_path}")
     
-    if config_file_path.is_file():
+    if config_file_exists:
         print(f"⚙️ Config File: {config_file_path}")
     elif args.config :
         print(f"⚙️ Config File: {config_file_path} (Specified but not found, using script defaults)")
@@ -312,7 +546,7 @@ def handle_run_command(args):
     if args.no_session_prompt:
         print(f"🎙️ Session Prompt: Disabled (via --no-session-prompt)")
     elif use_session_prompt and final_session_prompt_path:
-        if final_session_prompt_path.is_file():
+        if session_prompt_exists:
             print(f"🎙️ Session Prompt: {final_session_prompt_path}")
         else:
             print(f"🎙️ Session Prompt: {final_session_prompt_path} (File not found!)")
@@ -332,16 +566,13 @@ def handle_run_command(args):
         print(f"  Effective Exclude Patterns: {final_exclude_patterns}")
         print(f"---------------------------------")
 
-    session_prompt_content = ""
+    # The session prompt is read in the background while the project is scanned; its result is collected before writing.
+    prompt_future = None
     if use_session_prompt and final_session_prompt_path:
-        if final_session_prompt_path.is_file():
-            try:
-                with open(final_session_prompt_path, 'r', encoding=DEFAULT_ENCODING) as pf:
-                    session_prompt_content = pf.read()
-                session_prompt_content = session_prompt_content.replace("[root directory name]", root_path.name)
-                if args.verbose: print(f"ℹ️ Session prompt loaded from '{final_session_prompt_path}'.")
-            except Exception as e:
-                print(f"⚠️ Warning: Could not read session prompt file '{final_session_prompt_path}': {e}")
+        if session_prompt_exists:
+            prompt_executor = ThreadPoolExecutor(max_workers=1)
+            prompt_future = prompt_executor.submit(_load_session_prompt, final_session_prompt_path, root_path.name)
+            prompt_executor.shutdown(wait=False) # The submitted read still runs to completion
         else:
             print(f"⚠️ Warning: Session prompt file '{final_session_prompt_path}' was specified but not found. No session prompt will be prepended.")
 
@@ -352,81 +583,91 @@ def handle_run_command(args):
         return
 
     print(f"🔎 Scanning for files to include...")
-    files_to_process = []
-    for item_abs_path in root_path.rglob("*"):
-        if final_session_prompt_path and item_abs_path == final_session_prompt_path:
-            if args.verbose: print(f"DEBUG: Excluding session prompt file itself: {final_session_prompt_path.relative_to(root_path) if final_session_prompt_path.is_relative_to(root_path) else final_session_prompt_path}")
-            continue
-        if is_excluded(item_abs_path, root_path, final_exclude_patterns, final_output_path, args.verbose):
-            continue
-        if item_abs_path.is_file():
-            matched_extension = False
-            for ext_pattern in final_include_extensions:
-                if fnmatch.fnmatchcase(item_abs_path.name, ext_pattern):
-                    matched_extension = True
-                    break
-            if matched_extension:
-                files_to_process.append(item_abs_path)
-                if args.verbose: print(f"  ➕ Will include: {item_abs_path.relative_to(root_path)}")
-
-    if not files_to_process:
+    files_iter = _walk(root_path, compiled_patterns, final_output_path, final_session_prompt_path, args.verbose)
+    # Only enough files to decide on the large-run warning are collected up front; the rest is scanned while writing.
+    first_files = list(itertools.islice(files_iter, FILES_COUNT_WARNING_THRESHOLD + 1))
+
+    if not first_files:
         print("🤷 No files found matching the criteria.")
+    elif len(first_files) <= FILES_COUNT_WARNING_THRESHOLD:
+        print(f"Found {len(first_files)} file(s) to combine.")
     else:
-        print(f"Found {len(files_to_process)} file(s) to combine.")
-        if len(files_to_process) > FILES_COUNT_WARNING_THRESHOLD:
-            print(f"⚠️ Warning: Processing {len(files_to_process)} files, which is a large number.")
-            print(f"   Please ensure large directories (like 'node_modules/', 'build/', '.git/') are correctly excluded in '{config_file_path.name if config_file_path.is_file() else DEFAULT_CONFIG_FILENAME}'.")
-            try:
-                confirm_large_run = input("   Continue with this many files? (y/N): ")
-                if confirm_large_run.lower() != 'y':
-                    print("🛑 Aborted by user.")
-                    return
-            except Exception:
-                print("🛑 Aborted due to input error.")
+        print(f"⚠️ Warning: Found more than {FILES_COUNT_WARNING_THRESHOLD} files to process, which is a large number.")
+        print(f"   Please ensure large directories (like 'node_modules/', 'build/', '.git/') are correctly excluded in '{config_file_path.name if config_file_exists else DEFAULT_CONFIG_FILENAME}'.")
+        try:
+            confirm_large_run = input("   Continue with this many files? (y/N): ")
+            if confirm_large_run.lower() != 'y':
+                print("🛑 Aborted by user.")
                 return
+        except Exception:
+            print("🛑 Aborted due to input error.")
+            return
+
+    session_prompt_bytes = b""
+    if prompt_future:
+        try:
+            session_prompt_bytes = prompt_future.result()
+            if args.verbose: print(f"ℹ️ Session prompt loaded from '{final_session_prompt_path}'.")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not read session prompt file '{final_session_prompt_path}': {e}")
 
-    if args.verbose and files_to_process:
-        print(f"\n✍️ Starting to write {len(files_to_process)} files to {final_output_path}...")
+    if args.verbose and first_files:
+        print(f"\n✍️ Starting to write files to {final_output_path}...")
 
     try:
-        with open(final_output_path, 'w', encoding=DEFAULT_ENCODING) as outfile:
-            if session_prompt_content:
-                outfile.write(session_prompt_content)
-                outfile.write(SESSION_PROMPT_CODE_SEPARATOR)
+        # Binary output: headers are pre-encoded, and source bytes are only decoded when they are not plain ASCII.
+        with open(final_output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as outfile:
+            outfile.write(session_prompt_bytes)
             
-            if not files_to_process:
-                if not session_prompt_content and not final_no_header:
-                     outfile.write(f"# No code files found matching criteria in '{root_path}'\n")
-                     outfile.write(f"# Include Extensions: {final_include_extensions}\n")
-                     outfile.write(f"# Exclude Patterns: {final_exclude_patterns}\n")
-                elif session_prompt_content and not final_no_header:
-                     outfile.write(f"\n# No code files found matching criteria in '{root_path}' (after session prompt)\n")
+            if not first_files:
+                if not session_prompt_bytes and not final_no_header:
+                     outfile.write((f"# No code files found matching criteria in '{root_path}'\n"
+                                    f"# Include Extensions: {final_include_extensions}\n"
+                                    f"# Exclude Patterns: {final_exclude_patterns}\n").encode(DEFAULT_ENCODING))
+                elif session_prompt_bytes and not final_no_header:
+                     outfile.write(f"\n# No code files found matching criteria in '{root_path}' (after session prompt)\n".encode(DEFAULT_ENCODING))
                 print(f"Output file '{final_output_path}' created (contains session prompt and/or info header).")
                 return
 
-            for i, file_path_abs in enumerate(files_to_process):
-                relative_file_path = file_path_abs.relative_to(root_path)
-                if args.verbose: print(f"  Appending content of: {relative_file_path}")
-                if not final_no_header:
-                    outfile.write(f"--- START FILE: {relative_file_path} ---\n")
-                try:
-                    with open(file_path_abs, 'r', encoding=DEFAULT_ENCODING, errors='replace') as infile:
-                        outfile.write(infile.read())
-                except Exception as e:
-                    error_message = f"[Error reading file {relative_file_path}: {e}]"
-                    if args.verbose: print(f"    ⚠️ {error_message}")
-                    outfile.write(f"{error_message}\n" if not final_no_header else f"\n\n'''{error_message}'''\n\n")
-                
-                if not final_no_header:
-                    outfile.write(f"\n--- END FILE: {relative_file_path} ---")
-                
-                if i < len(files_to_process) - 1:
-                    outfile.write("\n\n")
-                elif not final_no_header :
-                    outfile.write("\n")
+            # Footer, separator and the next header are gathered here and written as one block before each file body.
+            pending_bytes = bytearray()
+            files_iter = itertools.chain(first_files, files_iter)
+            num_files = 0
+            with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+                # Scan, read and write form a pipeline: reads run up to READ_AHEAD files ahead of the writer,
+                # pulling paths from the walker as they go; results are taken in scan order.
+                read_queue = deque((file_rel_str, executor.submit(_read_bytes, file_abs_str)) for file_abs_str, file_rel_str in itertools.islice(files_iter, READ_AHEAD))
+                while read_queue:
+                    relative_file_path, read_future = read_queue.popleft()
+                    next_file = next(files_iter, None)
+                    if next_file:
+                        read_queue.append((next_file[1], executor.submit(_read_bytes, next_file[0])))
+
+                    if num_files:
+                        pending_bytes += b"\n\n" # Separator between files
+                    num_files += 1
+
+                    if args.verbose: print(f"  Appending content of: {relative_file_path}")
+                    if not final_no_header:
+                        pending_bytes += f"--- START FILE: {relative_file_path} ---\n".encode(DEFAULT_ENCODING)
+                    try:
+                        file_bytes = read_future.result()
+                        if pending_bytes:
+                            outfile.write(pending_bytes)
+                            pending_bytes.clear()
+                        outfile.write(file_bytes)
+                    except Exception as e:
+                        error_message = f"[Error reading file {relative_file_path}: {e}]"
+                        if args.verbose: print(f"    ⚠️ {error_message}")
+                        pending_bytes += (f"{error_message}\n" if not final_no_header else f"\n\n'''{error_message}'''\n\n").encode(DEFAULT_ENCODING)
+                    
+                    if not final_no_header:
+                        pending_bytes += f"\n--- END FILE: {relative_file_path} ---".encode(DEFAULT_ENCODING)
+            if not final_no_header:
+                pending_bytes += b"\n"
+            outfile.write(pending_bytes)
 
-            num_files = len(files_to_process)
-            prompt_msg = "session prompt and " if session_prompt_content else ""
+            prompt_msg = "session prompt and " if session_prompt_bytes else ""
             print(f"\n✅ Successfully combined {prompt_msg}{num_files} file{'s' if num_files != 1 else ''} into '{final_output_path}'.")
 
     except IOError as e: